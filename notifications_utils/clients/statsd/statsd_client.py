@@ -1,10 +1,11 @@
 import random
 import time
-from socket import AF_INET, SOCK_DGRAM, gethostbyname, socket
+from socket import AF_INET, MSG_DONTWAIT, SOCK_DGRAM, gethostbyname, socket
 
 import cachetools.func
 from flask import current_app
 from statsd.client.base import StatsClientBase
+from statsd.client.udp import Pipeline
 
 
 def time_monotonic_with_jitter():
@@ -13,12 +14,17 @@ def time_monotonic_with_jitter():
 
 
 class NotifyStatsClient(StatsClientBase):
-    def __init__(self, host, port, prefix):
+    def __init__(self, host, port, prefix, maxudpsize=512):
         self._host = host
         self._port = port
         self._prefix = prefix
+        self._maxudpsize = maxudpsize
         self._sock = socket(AF_INET, SOCK_DGRAM)
 
+    def pipeline(self):
+        # stats sent through a pipeline are joined with newlines and sent in as few packets as `_maxudpsize` allows
+        return Pipeline(self)
+
     def _resolve(self, addr):
         return gethostbyname(addr)
 
@@ -38,7 +44,10 @@ class NotifyStatsClient(StatsClientBase):
 
             # if we can't resolve DNS then host is none - just skip sending stats for next 15 secs
             if host:
-                self._sock.sendto(data.encode("ascii"), (host, self._port))
+                self._sock.sendto(data.encode("ascii"), MSG_DONTWAIT, (host, self._port))
+        except BlockingIOError:
+            # the socket's send buffer is full - drop the metric rather than waiting for space
+            pass
         except Exception as e:
             current_app.logger.warning("Error sending statsd metric: %s", e)
 
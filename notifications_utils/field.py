@@ -154,7 +154,7 @@ class Field:
 
     @property
     def _raw_formatted(self):
-        return re.sub(self.placeholder_pattern, self.format_match, self.sanitizer(self.content))
+        return self.placeholder_pattern.sub(self.format_match, self.sanitizer(self.content))
 
     @property
     def formatted(self):
@@ -164,11 +164,11 @@ class Field:
     def placeholders(self):
         if not getattr(self, "content", ""):
             return set()
-        return OrderedSet(Placeholder(body).name for body in re.findall(self.placeholder_pattern, self.content))
+        return OrderedSet(Placeholder(body).name for body in self.placeholder_pattern.findall(self.content))
 
     @property
     def replaced(self):
-        return re.sub(self.placeholder_pattern, self.replace_match, self.sanitizer(self.content))
+        return self.placeholder_pattern.sub(self.replace_match, self.sanitizer(self.content))
 
 
 class PlainTextField(Field):
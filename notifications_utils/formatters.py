@@ -54,13 +54,15 @@ url = re.compile(
 
 more_than_two_newlines_in_a_row = re.compile(r"\n{3,}")
 
+newline_or_carriage_return = re.compile(r"[\n\r]")
+
 
 def unlink_govuk_escaped(message):
     return re.sub(govuk_not_a_link, r"\1\2\3" + ".\u200b" + r"\4", message)  # Unicode zero-width space
 
 
 def nl2br(value):
-    return re.sub(r"\n|\r", "<br>", value.strip())
+    return newline_or_carriage_return.sub("<br>", value.strip())
 
 
 def add_prefix(body, prefix=None):
@@ -257,11 +259,14 @@ def normalise_whitespace(value):
     # inner whitespace with width becomes a single space
     # inner whitespace with zero width is removed
     # multiple space characters next to each other become just a single space character
-    for character in OBSCURE_FULL_WIDTH_WHITESPACE:
-        value = value.replace(character, " ")
-
-    for character in OBSCURE_ZERO_WIDTH_WHITESPACE:
-        value = value.replace(character, "")
+    if not value.isascii():
+        # None of the obscure whitespace characters are ASCII, so only
+        # look for them if there’s a chance of finding them
+        for character in OBSCURE_FULL_WIDTH_WHITESPACE:
+            value = value.replace(character, " ")
+
+        for character in OBSCURE_ZERO_WIDTH_WHITESPACE:
+            value = value.replace(character, "")
 
     return " ".join(value.split())
 
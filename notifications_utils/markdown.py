@@ -17,6 +17,9 @@ from notifications_utils.qr_code import (
 
 LINK_STYLE = "word-wrap: break-word; color: #1D70B8;"
 
+link_protocol = re.compile(r"^(https?://)")
+qr_code_link_with_original_protocol = re.compile(r"<strong data-original-protocol='(https?://|)'>(.*?)</strong>")
+
 mistune._block_quote_leading_pattern = re.compile(r"^ *\^ ?", flags=re.M)
 mistune.BlockGrammar.block_quote = re.compile(r"^( *\^[^\n]+(\n[^\n]+)*\n*)+")
 mistune.BlockGrammar.list_block = re.compile(
@@ -92,9 +95,7 @@ class NotifyLetterMarkdownPreviewRenderer(mistune.Renderer):
         if qr_code_contents := qr_code_contents_from_paragraph(text):
             # Restore http:// or https:// and strip out the <strong> tag that gets injected by
             # the `link`/`autolink` methods
-            text = self._render_qr_data(
-                re.sub(r"<strong data-original-protocol='(https?://|)'>(.*?)</strong>", r"\1\2", qr_code_contents)
-            )
+            text = self._render_qr_data(qr_code_link_with_original_protocol.sub(r"\1\2", qr_code_contents))
 
         return f"<p>{text}</p>"
 
@@ -102,12 +103,10 @@ class NotifyLetterMarkdownPreviewRenderer(mistune.Renderer):
         return ""
 
     def autolink(self, link, is_email=False):
-        proto_matcher = re.compile(r"^(https?://)")
-
         protocol = ""
-        if match := proto_matcher.match(link):
+        if match := link_protocol.match(link):
             protocol = match.group(1)
-            link = proto_matcher.sub("", link, 1)
+            link = link_protocol.sub("", link, 1)
 
         return f"<strong data-original-protocol='{protocol}'>{link}</strong>"
 
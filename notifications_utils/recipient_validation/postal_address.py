@@ -23,6 +23,10 @@ address_line_7_key = "address_line_7"
 address_lines_1_to_7_keys = address_lines_1_to_6_keys + [address_line_7_key]
 country_UK = Country(UK)
 
+bfpo_matcher = re.compile(r"^\s*bfpo\s*(?:c\/o)?(?:\s*(\d+))?\s*$")
+no_fixed_abode = re.compile(r"no fixed (abode|address)", re.IGNORECASE)
+uk_postcode = re.compile(rf"(({'|'.join(UK_POSTCODE_ZONES)})[0-9][0-9A-Z]?[0-9][A-BD-HJLNP-UW-Z]{{2}})")
+
 
 class PostalAddress:
     MIN_LINES = 3
@@ -34,9 +38,9 @@ class PostalAddress:
         self.allow_international_letters = allow_international_letters
 
         self._lines = [
-            remove_whitespace_before_punctuation(line.rstrip(" ,"))
+            remove_whitespace_before_punctuation(stripped_line)
             for line in get_lines_with_normalised_whitespace(self.raw_address)
-            if line.rstrip(" ,")
+            if (stripped_line := line.rstrip(" ,"))
         ] or [""]
 
         self._bfpo_number, self._lines_without_bfpo = self._parse_and_extract_bfpo(self._lines)
@@ -66,7 +70,6 @@ class PostalAddress:
         return f"{self.__class__.__name__}({repr(self.raw_address)})"
 
     def _parse_and_extract_bfpo(self, lines):
-        bfpo_matcher = re.compile(r"^\s*bfpo\s*(?:c\/o)?(?:\s*(\d+))?\s*$")
         bfpo_number_line = next(
             filter(lambda line: bfpo_matcher.match(line.lower()) and bfpo_matcher.match(line.lower()).group(1), lines),
             None,
@@ -155,7 +158,7 @@ class PostalAddress:
         """
         if any(line.lower() == "nfa" for line in self.normalised_lines):
             return True
-        if re.search(r"no fixed (abode|address)", self.normalised, re.IGNORECASE):
+        if no_fixed_abode.search(self.normalised):
             return True
         return False
 
@@ -243,8 +246,7 @@ def normalise_postcode(postcode):
 
 def _is_a_real_uk_postcode(postcode):
     normalised = normalise_postcode(postcode)
-    pattern = re.compile(rf"(({'|'.join(UK_POSTCODE_ZONES)})[0-9][0-9A-Z]?[0-9][A-BD-HJLNP-UW-Z]{{2}})")
-    return bool(pattern.fullmatch(normalised))
+    return bool(uk_postcode.fullmatch(normalised))
 
 
 def format_postcode_for_printing(postcode):
@@ -145,6 +145,11 @@ class RecipientCSV:
     def get_rows(self):
         column_headers = self._raw_column_headers  # this is for caching
         length_of_column_headers = len(column_headers)
+        recipient_columns = {
+            column_name
+            for column_name in column_headers
+            if InsensitiveDict.make_key(column_name) in self.recipient_column_headers_as_column_keys
+        }
 
         rows_as_lists_of_columns = self._rows
 
@@ -160,7 +165,7 @@ class RecipientCSV:
             for column_name, column_value in zip(column_headers, row, strict=False):
                 column_value = strip_and_remove_obscure_whitespace(column_value)
 
-                if InsensitiveDict.make_key(column_name) in self.recipient_column_headers_as_column_keys:
+                if column_name in recipient_columns:
                     output_dict[column_name] = column_value or None
                 else:
                     insert_or_append_to_dict(output_dict, column_name, column_value or None)
@@ -432,10 +437,12 @@ class Row(InsensitiveDict):
     def as_postal_address(self):
         from notifications_utils.recipient_validation.postal_address import PostalAddress
 
-        return PostalAddress.from_personalisation(
-            self.recipient_and_personalisation,
-            allow_international_letters=self.allow_international_letters,
-        )
+        if not hasattr(self, "_postal_address"):
+            self._postal_address = PostalAddress.from_personalisation(
+                self.recipient_and_personalisation,
+                allow_international_letters=self.allow_international_letters,
+            )
+        return self._postal_address
 
     @property
     def personalisation(self):
@@ -1,4 +1,30 @@
+import itertools
 import unicodedata
+from functools import lru_cache
+
+HEX_DIGITS = frozenset("0123456789ABCDEF")
+
+
+class _EncodingTable(dict):
+    """
+    A mapping of codepoint to encoded character, suitable for passing to `str.translate`.
+
+    Entries are computed with `sanitiser.encode_char` the first time a codepoint is seen, so that each distinct
+    character only goes through the decomposition logic once. Content is user-supplied, so the table stops storing new
+    entries once it reaches `max_size` rather than growing for the life of the process.
+    """
+
+    max_size = 4096
+
+    def __init__(self, sanitiser):
+        super().__init__()
+        self.sanitiser = sanitiser
+
+    def __missing__(self, codepoint):
+        encoded = self.sanitiser.encode_char(chr(codepoint))
+        if len(self) < self.max_size:
+            self[codepoint] = encoded
+        return encoded
 
 
 class SanitiseText:
@@ -27,9 +53,28 @@ class SanitiseText:
         "ł": "l",  # LATIN SMALL LETTER L WITH STROKE (U+0142)
     }
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._build_encoding_table()
+
+    @classmethod
+    def _build_encoding_table(cls):
+        cls._encoding_table = _EncodingTable(cls)
+        # Fill in the characters we expect to see most often (Latin-1, Latin Extended-A, and anything we allow or have
+        # a specific replacement for) up front, so that encoding typical content never has to drop back into Python
+        cls._encoding_table.update(
+            {
+                ord(c): cls.encode_char(c)
+                for c in itertools.chain(map(chr, range(0x180)), cls.ALLOWED_CHARACTERS, cls.REPLACEMENT_CHARACTERS)
+            }
+        )
+        cls._non_compatible_ascii_characters = frozenset(
+            c for c in map(chr, range(128)) if not cls.is_compatible_character(c)
+        )
+
     @classmethod
     def encode(cls, content):
-        return "".join(cls.encode_char(char) for char in content)
+        return content.translate(cls._encoding_table)
 
     @classmethod
     def get_non_compatible_characters(cls, content):
@@ -38,21 +83,32 @@ class SanitiseText:
 
         This follows the same rules as `cls.encode`, but returns just the characters that encode would replace with `?`
         """
-        return {c for c in content if c not in cls.ALLOWED_CHARACTERS and cls.downgrade_character(c) is None}
+        if content.isascii():
+            # most messages are plain ascii, so we can skip looking at each character individually
+            return set(content) & cls._non_compatible_ascii_characters
+        return {c for c in set(content) - cls.ALLOWED_CHARACTERS if cls.downgrade_character(c) is None}
+
+    @classmethod
+    def is_compatible_character(cls, c):
+        """
+        Return True if the character is either in the allowed set or has a known downgrade
+        """
+        return c in cls.ALLOWED_CHARACTERS or cls.downgrade_character(c) is not None
 
     @staticmethod
     def get_unicode_char_from_codepoint(codepoint):
         """
         Given a unicode codepoint (eg 002E for '.', 0061 for 'a', etc), return that actual unicode character.
 
-        unicodedata.decomposition returns strings containing codepoints, so we need to eval them ourselves
+        unicodedata.decomposition returns strings containing codepoints, so we need to convert them ourselves
         """
-        # lets just make sure we aren't evaling anything weird
-        if not set(codepoint) <= set("0123456789ABCDEF") or not len(codepoint) == 4:
+        # `int` is more lenient than we want (it accepts whitespace, underscores and signs) so check the format first
+        if len(codepoint) != 4 or not HEX_DIGITS.issuperset(codepoint):
             raise ValueError(f"{codepoint} is not a valid unicode codepoint")
-        return eval(f'"\\u{codepoint}"')
+        return chr(int(codepoint, 16))
 
     @classmethod
+    @lru_cache(maxsize=4096)
     def downgrade_character(cls, c):
         """
         Attempt to downgrade a non-compatible character to the allowed character set. May downgrade to multiple
@@ -88,6 +144,9 @@ class SanitiseText:
             return c if c is not None else "?"
 
 
+SanitiseText._build_encoding_table()
+
+
 class SanitiseSMS(SanitiseText):
     """
     Given an input string, makes it GSM and Welsh character compatible. This involves removing all non-gsm characters by
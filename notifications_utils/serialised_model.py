@@ -24,25 +24,87 @@ class SerialisedModel:
     annotations.
     """
 
-    def __new__(cls, *args, **kwargs):
+    _coercers = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Work out each subclass’s fields and how to coerce them once, rather than every time it’s instantiated
         for parent in cls.__mro__:
             cls.__annotations__ = getattr(parent, "__annotations__", {}) | cls.__annotations__
-        return super().__new__(cls)
+        cls._coercers = {property: cls.get_coercer(type_) for property, type_ in cls.__annotations__.items()}
+        if getattr(cls.coerce_value_to_type, "__func__", None) is SerialisedModel.coerce_value_to_type.__func__:
+            cls._set_fields = _make_set_fields(cls._coercers)
+        else:
+            # Subclasses which override `coerce_value_to_type` need it calling for every field, like it always was
+            cls._set_fields = _set_fields_with_coerce_value_to_type
 
     def __init__(self, _dict):
-        for property, type_ in self.__annotations__.items():
-            value = self.coerce_value_to_type(_dict[property], type_)
-            setattr(self, property, value)
+        self._set_fields(_dict)
 
-    @staticmethod
-    def coerce_value_to_type(value, type_):
-        if type_ is Any or value is None:
+    def _set_fields(self, _dict):
+        pass
+
+    @classmethod
+    def coerce_value_to_type(cls, value, type_):
+        if value is None:
             return value
 
+        return cls.get_coercer(type_)(value)
+
+    @staticmethod
+    def get_coercer(type_):
+        if type_ is Any:
+            return _do_not_coerce
+
+        if not isinstance(type_, type):
+            # Annotations like `str | None` aren’t classes, so can’t be checked with `issubclass`
+            return type_
+
         if issubclass(type_, datetime):
+            return _coerce_to_utc_datetime
+
+        return type_
+
+
+def _make_set_fields(coercers):
+    """
+    Generate a method which sets each field from the dictionary as a plain attribute assignment, like
+    `dataclasses` does for `__init__`. This is much quicker than looping over the fields and calling `setattr`.
+    """
+    namespace = {}
+    lines = ["def _set_fields(self, _dict):", "    pass"]
+
+    for index, (property, coercer) in enumerate(coercers.items()):
+        if coercer is _do_not_coerce:
+            lines.append(f"    self.{property} = _dict[{property!r}]")
+        else:
+            namespace[f"_coercer_{index}"] = coercer
+            lines.append(f"    value = _dict[{property!r}]")
+            lines.append(f"    self.{property} = value if value is None else _coercer_{index}(value)")
+
+    exec("\n".join(lines), namespace)
+    return namespace["_set_fields"]
+
+
+def _set_fields_with_coerce_value_to_type(self, _dict):
+    for property, type_ in self.__annotations__.items():
+        setattr(self, property, self.coerce_value_to_type(_dict[property], type_))
+
+
+def _do_not_coerce(value):
+    return value
+
+
+def _coerce_to_utc_datetime(value):
+    if isinstance(value, str):
+        try:
+            # Much quicker than dateutil for the ISO 8601 strings our APIs return
+            value = datetime.fromisoformat(value)
+        except ValueError:
             return utc_string_to_aware_gmt_datetime(value).astimezone(UTC)
 
-        return type_(value)
+    # Like `utc_string_to_aware_gmt_datetime`, treat the time as UTC regardless of any offset it has
+    return value.replace(tzinfo=UTC)
 
 
 class SerialisedModelCollection(ABC):
@@ -60,11 +122,32 @@ class SerialisedModelCollection(ABC):
     def __init__(self, items):
         self.items = items
 
+    @property
+    def items(self):
+        return self._items
+
+    @items.setter
+    def items(self, items):
+        self._items = items
+        # Models are cached by index so that iterating over the collection more than once doesn’t rebuild them. Each
+        # is stored with the item it was built from, so that changing the list in place (sorting it, say) rebuilds them
+        self._models = {}
+
     def __bool__(self):
         return bool(self.items)
 
     def __getitem__(self, index):
-        return self.model(self.items[index])
+        # Index the list first so that out of range indexes raise `IndexError` as they would for a list
+        item = self.items[index]
+        if index < 0:
+            index += len(self.items)
+        if index in self._models:
+            cached_item, model = self._models[index]
+            if cached_item is item:
+                return model
+        model = self.model(item)
+        self._models[index] = item, model
+        return model
 
     def __len__(self):
         return len(self.items)
@@ -8,10 +8,13 @@ def statsd(namespace):
     def time_function(func):
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
-            start_time = time.monotonic()
+            if not current_app.statsd_client.active:
+                return func(*args, **kwargs)
+
+            start_time = time.perf_counter()
             try:
                 res = func(*args, **kwargs)
-                elapsed_time = time.monotonic() - start_time
+                elapsed_time = time.perf_counter() - start_time
                 current_app.statsd_client.incr(f"{namespace}.{func.__name__}")
                 current_app.statsd_client.timing(f"{namespace}.{func.__name__}", elapsed_time)
 
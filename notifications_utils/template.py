@@ -56,7 +56,10 @@ template_env = Environment(
             path.dirname(path.abspath(__file__)),
             "jinja_templates",
         )
-    )
+    ),
+    # These templates are part of the package so can't change while it's running. Without this Jinja checks the
+    # modification time of every `{% include %}`d template each time a letter is rendered
+    auto_reload=False,
 )
 
 
@@ -755,7 +758,12 @@ def non_gsm_characters(content):
     emoji, ellipsis, ñ, etc). This only includes welsh non gsm characters that will force the entire SMS to be encoded
     with UCS-2.
     """
-    return set(content) & set(SanitiseSMS.WELSH_NON_GSM_CHARACTERS)
+    # Once a message is more than about a text message long, searching it for each of the few dozen Welsh characters is
+    # quicker than hashing every character of it. For shorter messages the set is quicker
+    if len(content) > 150:
+        return {character for character in SanitiseSMS.WELSH_NON_GSM_CHARACTERS if character in content}
+
+    return set(content) & SanitiseSMS.WELSH_NON_GSM_CHARACTERS
 
 
 def count_extended_gsm_chars(content):
@@ -1,6 +1,7 @@
 import logging
 from datetime import datetime, timedelta
-from unittest.mock import Mock, patch
+from socket import MSG_DONTWAIT
+from unittest.mock import Mock, call, patch
 
 import pytest
 
@@ -43,6 +44,14 @@ def test_should_create_correctly_formatted_namespace(enabled_statsd_client):
     assert enabled_statsd_client.format_stat_name("test") == "test.notifications.api.test"
 
 
+def test_namespace_is_built_once_at_init_app(app, enabled_statsd_client):
+    app.config["NOTIFY_ENVIRONMENT"] = "production"
+
+    enabled_statsd_client.incr("key")
+
+    enabled_statsd_client.statsd_client.incr.assert_called_with("test.notifications.api.key", 1, 1)
+
+
 def test_should_not_call_incr_if_not_enabled(disabled_statsd_client):
     disabled_statsd_client.incr("key")
     disabled_statsd_client.statsd_client.incr.assert_not_called()
@@ -111,6 +120,28 @@ def test_should_log_but_not_throw_if_socket_errors(app, mocker, caplog):
     assert "Error sending statsd metric: Mock Exception" in caplog.messages
 
 
+def test_should_send_without_blocking(app, mocker):
+    stats_client = NotifyStatsClient("localhost", 8125, "")
+    mock_sock = mocker.patch.object(stats_client, "_sock")
+    mocker.patch.object(stats_client, "_cached_host", return_value="1.2.3.4")
+
+    stats_client._send("data")
+
+    mock_sock.sendto.assert_called_once_with(b"data", MSG_DONTWAIT, ("1.2.3.4", 8125))
+
+
+def test_should_drop_metric_without_logging_if_socket_would_block(app, mocker, caplog):
+    stats_client = NotifyStatsClient("localhost", 8125, "")
+    mocker.patch.object(stats_client, "_sock")
+    mocker.patch.object(stats_client, "_cached_host", return_value="1.2.3.4")
+    stats_client._sock.sendto = Mock(side_effect=BlockingIOError("Resource temporarily unavailable"))
+
+    with caplog.at_level(logging.WARNING):
+        stats_client._send("data")
+
+    assert caplog.messages == []
+
+
 def test_should_not_attempt_to_send_if_cache_contains_none(app, mocker):
     stats_client = NotifyStatsClient("localhost", 8125, "")
     mock_sock = mocker.patch.object(stats_client, "_sock")
@@ -151,3 +182,63 @@ def test_should_cache_none_if_dns_fails(app, mocker):
     with patch.object(stats_client, "_resolve") as mock_dns_lookup:
         assert stats_client._cached_host() is None
         assert mock_dns_lookup.called is False
+
+
+def test_should_resolve_dns_again_once_cache_expires(app, mocker):
+    stats_client = NotifyStatsClient("exporter.apps.internal", 8125, "")
+    mocker.patch("notifications_utils.clients.statsd.statsd_client.random.uniform", return_value=0)
+    mock_monotonic = mocker.patch("notifications_utils.clients.statsd.statsd_client.time.monotonic", return_value=1000)
+
+    with patch.object(stats_client, "_resolve", return_value="1.2.3.4"):
+        assert stats_client._cached_host() == "1.2.3.4"
+
+    mock_monotonic.return_value = 1014
+
+    with patch.object(stats_client, "_resolve", return_value="5.6.7.8") as mock_dns_lookup:
+        assert stats_client._cached_host() == "1.2.3.4"
+        assert mock_dns_lookup.called is False
+
+    mock_monotonic.return_value = 1016
+
+    with patch.object(stats_client, "_resolve", return_value="5.6.7.8") as mock_dns_lookup:
+        assert stats_client._cached_host() == "5.6.7.8"
+        mock_dns_lookup.assert_called_once_with("exporter.apps.internal")
+
+
+def test_pipeline_sends_stats_in_a_single_packet(app, mocker):
+    stats_client = NotifyStatsClient("localhost", 8125, "")
+    mock_sock = mocker.patch.object(stats_client, "_sock")
+    mocker.patch.object(stats_client, "_cached_host", return_value="1.2.3.4")
+
+    with stats_client.pipeline() as pipe:
+        pipe.incr("key")
+        pipe.timing("key", 100)
+        pipe.gauge("key", 5)
+
+    mock_sock.sendto.assert_called_once_with(b"key:1|c\nkey:100.000000|ms\nkey:5|g", MSG_DONTWAIT, ("1.2.3.4", 8125))
+
+
+def test_pipeline_splits_stats_at_max_udp_size(app, mocker):
+    stats_client = NotifyStatsClient("localhost", 8125, "", maxudpsize=16)
+    mock_sock = mocker.patch.object(stats_client, "_sock")
+    mocker.patch.object(stats_client, "_cached_host", return_value="1.2.3.4")
+
+    with stats_client.pipeline() as pipe:
+        pipe.incr("key")
+        pipe.incr("key")
+        pipe.incr("other")
+
+    assert mock_sock.sendto.call_args_list == [
+        call(b"key:1|c\nkey:1|c", MSG_DONTWAIT, ("1.2.3.4", 8125)),
+        call(b"other:1|c", MSG_DONTWAIT, ("1.2.3.4", 8125)),
+    ]
+
+
+def test_negative_gauge_is_sent_through_a_pipeline(app, mocker):
+    stats_client = NotifyStatsClient("localhost", 8125, "")
+    mock_sock = mocker.patch.object(stats_client, "_sock")
+    mocker.patch.object(stats_client, "_cached_host", return_value="1.2.3.4")
+
+    stats_client.gauge("key", -5)
+
+    mock_sock.sendto.assert_called_once_with(b"key:0|g\nkey:-5|g", MSG_DONTWAIT, ("1.2.3.4", 8125))
@@ -218,8 +218,9 @@ def test_has_too_many_lines(address, too_many_lines_expected):
     ),
 )
 def test_postcode(address, expected_postcode):
-    assert PostalAddress(address).has_valid_postcode is bool(expected_postcode)
-    assert PostalAddress(address).postcode == expected_postcode
+    postal_address = PostalAddress(address)
+    assert postal_address.has_valid_postcode is bool(expected_postcode)
+    assert postal_address.postcode == expected_postcode
 
 
 @pytest.mark.parametrize(
@@ -424,8 +425,9 @@ def test_international(address, expected_international):
     ),
 )
 def test_normalised(address, expected_normalised, expected_as_single_line):
-    assert PostalAddress(address).normalised == expected_normalised
-    assert PostalAddress(address).as_single_line == expected_as_single_line
+    postal_address = PostalAddress(address)
+    assert postal_address.normalised == expected_normalised
+    assert postal_address.as_single_line == expected_as_single_line
 
 
 @pytest.mark.parametrize(
@@ -66,8 +66,9 @@ def test_all_synonyms():
 def test_crowdsourced_test_data():
     for search, expected_country, expected_postage in CROWDSOURCED_MISTAKES:
         if expected_country or expected_postage:
-            assert Country(search).canonical_name == expected_country
-            assert Country(search).postage_zone == expected_postage
+            country = Country(search)
+            assert country.canonical_name == expected_country
+            assert country.postage_zone == expected_postage
 
 
 @pytest.mark.parametrize(
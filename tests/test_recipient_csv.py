@@ -1204,6 +1204,24 @@ def test_accepts_international_addresses_when_allowed(extra_args, expected_error
     assert recipients[0].as_postal_address.country == Country("Fiji")
 
 
+def test_postal_address_is_only_built_once_per_row(mocker):
+    from_personalisation = mocker.patch(
+        "notifications_utils.recipient_validation.postal_address.PostalAddress.from_personalisation",
+        side_effect=lambda *args, **kwargs: Mock(valid=True),
+    )
+    recipients = RecipientCSV(
+        """
+            address_line_1, address_line_2, postcode
+            First Lastname, 123 Example St, SW1A 1AA
+        """,
+        template=_sample_template("letter"),
+    )
+
+    assert recipients[0].as_postal_address is recipients[0].as_postal_address
+    assert recipients[0].has_bad_recipient is False
+    assert from_personalisation.call_count == 1
+
+
 def test_address_validation_speed():
     # We should be able to validate 1000 lines of address data in about
     # a second – if it starts to get slow, something is inefficient
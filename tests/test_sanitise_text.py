@@ -65,7 +65,19 @@ def test_get_unicode_char_from_codepoint(codepoint, char):
     assert SanitiseText.get_unicode_char_from_codepoint(codepoint) == char
 
 
-@pytest.mark.parametrize("bad_input", ["", "GJ", "00001", '0001";import sys;sys.exit(0)"'])
+@pytest.mark.parametrize(
+    "bad_input",
+    [
+        "",
+        "GJ",
+        "00001",
+        " 041",
+        "+041",
+        "0_41",
+        "004a",
+        '0001";import sys;sys.exit(0)"',
+    ],
+)
 def test_get_unicode_char_from_codepoint_rejects_bad_input(bad_input):
     with pytest.raises(ValueError):
         SanitiseText.get_unicode_char_from_codepoint(bad_input)
@@ -84,6 +96,12 @@ def test_encode_string(content, expected):
     assert SanitiseASCII.encode(content) == expected
 
 
+@pytest.mark.parametrize("cls", [SanitiseSMS, SanitiseASCII])
+def test_encode_matches_encode_char_for_every_character(cls):
+    content = "Łōdź – “quick” brown fox…\tŴêlsh\n€ 🐮 \u200b↉" * 2
+    assert cls.encode(content) == "".join(cls.encode_char(char) for char in content)
+
+
 @pytest.mark.parametrize(
     "content, cls, expected",
     [
@@ -93,8 +111,51 @@ def test_encode_string(content, expected):
         ("Ŵêlsh chârâctêrs ârê cômpâtîblê wîth SanitiseSMS", SanitiseSMS, set()),
         ("Lots of GSM chars that arent ascii compatible:\n\r€", SanitiseSMS, set()),
         ("Lots of GSM chars that arent ascii compatible:\n\r€", SanitiseASCII, {"\n", "\r", "€"}),
+        ("Plain ascii with a `backtick` and a\ttab", SanitiseSMS, {"`"}),
+        ("Plain ascii with a `backtick` and a\ttab", SanitiseASCII, set()),
+        ("Plain ascii with a \x00 null and a\nnewline", SanitiseASCII, {"\x00", "\n"}),
         ("Obscure\u00a0whitespace\u202fcharacters which \u2028we \u2029normalise o\u180eut", SanitiseSMS, set()),
     ],
 )
 def test_sms_encoding_get_non_compatible_characters(content, cls, expected):
     assert cls.get_non_compatible_characters(content) == expected
+
+
+@pytest.mark.parametrize(
+    "cls, expected",
+    (
+        (SanitiseSMS, 'Ŵêlsh "quick" brown fox - £5 ok'),
+        (SanitiseASCII, 'Welsh "quick" brown fox - ?5 ok'),
+    ),
+)
+def test_encoding_table_is_prefilled_with_common_characters(cls, expected):
+    # A new subclass gets its own table, so other tests can’t have already encoded these characters
+    class _Fresh(cls):
+        pass
+
+    content = "Ŵêlsh “quick” brown fox – £5\tok"
+
+    assert all(ord(character) in _Fresh._encoding_table for character in content)
+    assert _Fresh.encode(content) == expected
+
+
+@pytest.mark.parametrize("char, replacement", SanitiseText.REPLACEMENT_CHARACTERS.items())
+@pytest.mark.parametrize("cls", [SanitiseSMS, SanitiseASCII])
+def test_replacement_characters_are_in_encoding_table(cls, char, replacement):
+    assert cls._encoding_table[ord(char)] == replacement
+    assert cls.encode(f"a{char}b") == f"a{replacement}b"
+
+
+@pytest.mark.parametrize("cls", [SanitiseSMS, SanitiseASCII])
+def test_encoding_table_stops_growing_at_max_size(cls, mocker):
+    mocker.patch.object(cls._encoding_table, "max_size", len(cls._encoding_table))
+
+    # private use area characters, which nothing else should have encoded
+    assert cls.encode("a\ue000b\ue001") == "a?b?"
+    assert ord("\ue000") not in cls._encoding_table
+    assert ord("\ue001") not in cls._encoding_table
+
+
+def test_base_class_encodes_everything_as_incompatible():
+    assert SanitiseText.encode("ab") == "??"
+    assert SanitiseText.get_non_compatible_characters("ab") == {"a", "b"}
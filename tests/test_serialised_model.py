@@ -1,6 +1,6 @@
 import sys
 from datetime import UTC, datetime
-from typing import Any
+from typing import Any, Optional
 from uuid import UUID
 
 import pytest
@@ -215,6 +215,13 @@ def test_serialised_model_collection_returns_models_from_list():
     assert instance[0].x == "foo"
     assert instance[1].x == "bar"
     assert instance[2].x == "baz"
+    assert instance[-1].x == "baz"
+
+    with pytest.raises(IndexError):
+        instance[3]
+
+    with pytest.raises(IndexError):
+        instance[-4]
 
     assert [item.x for item in instance] == [
         "foo",
@@ -256,3 +263,146 @@ def test_serialised_model_collection_returns_models_from_list():
         "bar",
         "baz",
     ]
+
+
+def test_annotations_are_merged_once_per_class(mocker):
+    class Parent(SerialisedModel):
+        foo: int
+
+    class Child(Parent):
+        bar: str
+
+    assert Child.__annotations__ == {"foo": int, "bar": str}
+
+    mock_get_coercer = mocker.patch.object(SerialisedModel, "get_coercer")
+
+    instance = Child({"foo": "1", "bar": 2})
+
+    assert instance.foo == 1
+    assert instance.bar == "2"
+    assert mock_get_coercer.called is False
+
+
+@pytest.mark.parametrize(
+    "value, type_, expected",
+    (
+        (None, int, None),
+        ("1", int, 1),
+        (1, str, "1"),
+        ({"a": 1}, Any, {"a": 1}),
+        ("2024-03-02T01:00:00.000000Z", datetime, datetime(2024, 3, 2, 1, 0, tzinfo=UTC)),
+        ("2024-03-02T01:00:00", datetime, datetime(2024, 3, 2, 1, 0, tzinfo=UTC)),
+        ("2024-07-02 01:00:00.123456", datetime, datetime(2024, 7, 2, 1, 0, 0, 123456, tzinfo=UTC)),
+        ("2024-07-02T01:00:00+01:00", datetime, datetime(2024, 7, 2, 1, 0, tzinfo=UTC)),
+        ("Tue, 02 Jul 2024 01:00:00 GMT", datetime, datetime(2024, 7, 2, 1, 0, tzinfo=UTC)),
+        (datetime(2024, 7, 2, 1, 0), datetime, datetime(2024, 7, 2, 1, 0, tzinfo=UTC)),
+    ),
+)
+def test_coerce_value_to_type(value, type_, expected):
+    assert SerialisedModel.coerce_value_to_type(value, type_) == expected
+
+
+def test_subclass_can_extend_init():
+    class Custom(SerialisedModel):
+        foo: int
+        bar: Any
+
+        def __init__(self, _dict, baz):
+            super().__init__(_dict)
+            self.baz = baz
+
+    instance = Custom({"foo": "1", "bar": None}, baz="qux")
+
+    assert instance.foo == 1
+    assert instance.bar is None
+    assert instance.baz == "qux"
+
+
+def test_subclass_can_override_coerce_value_to_type():
+    class Custom(SerialisedModel):
+        foo: int
+        bar: Any
+
+        @staticmethod
+        def coerce_value_to_type(value, type_):
+            return "overridden"
+
+    class Child(Custom):
+        baz: str
+
+    assert Custom({"foo": "1", "bar": None}).foo == "overridden"
+    assert Custom({"foo": "1", "bar": None}).bar == "overridden"
+    assert Child({"foo": "1", "bar": None, "baz": 2}).baz == "overridden"
+
+
+def test_fields_can_be_annotated_with_types_which_are_not_classes():
+    class Custom(SerialisedModel):
+        foo: Optional[str]  # noqa: UP007
+        bar: str | None
+        baz: "str"
+
+    instance = Custom({"foo": None, "bar": None, "baz": None})
+
+    assert instance.foo is None
+    assert instance.bar is None
+    assert instance.baz is None
+
+
+def test_serialised_model_collection_only_builds_each_model_once(mocker):
+    class Custom(SerialisedModel):
+        x: Any
+
+    class CustomCollection(SerialisedModelCollection):
+        model = Custom
+
+    instance = CustomCollection([{"x": "foo"}, {"x": "bar"}])
+    mock_init = mocker.spy(Custom, "__init__")
+
+    assert instance[0] is instance[0] is instance[-2]
+    assert list(instance) == list(instance)
+    assert mock_init.call_count == 2
+
+    instance.items = [{"x": "baz"}]
+
+    assert instance[0].x == "baz"
+    assert len(instance) == 1
+    assert mock_init.call_count == 3
+
+
+def test_serialised_model_collection_rebuilds_models_when_items_change_in_place():
+    class Custom(SerialisedModel):
+        x: Any
+
+    class CustomCollection(SerialisedModelCollection):
+        model = Custom
+
+    instance = CustomCollection([{"x": "foo"}, {"x": "bar"}])
+    assert [model.x for model in instance] == ["foo", "bar"]
+
+    instance.items.sort(key=lambda item: item["x"])
+
+    assert [model.x for model in instance] == ["bar", "foo"]
+
+    instance.items.insert(0, {"x": "baz"})
+
+    assert [model.x for model in instance] == ["baz", "bar", "foo"]
+    assert instance[-1] is instance[2]
+
+
+def test_adding_serialised_model_collections_reuses_built_models():
+    class Custom(SerialisedModel):
+        x: Any
+
+    class CustomCollection(SerialisedModelCollection):
+        model = Custom
+
+    instance = CustomCollection([{"x": "foo"}, {"x": "bar"}])
+    instance_2 = CustomCollection([{"x": "baz"}])
+
+    combined = instance + instance_2
+
+    assert isinstance(combined, list)
+    assert combined[0] is instance[0]
+    assert combined[1] is instance[1]
+    assert combined[2] is instance_2[0]
+    assert (instance_2 + instance)[2] is instance[1]
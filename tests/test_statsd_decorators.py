@@ -27,3 +27,33 @@ def test_should_call_statsd(app, caplog):
     assert AnyStringWith("test call test_function took ") in caplog.messages
     app.statsd_client.incr.assert_called_once_with("test.test_function")
     app.statsd_client.timing.assert_called_once_with("test.test_function", ANY)
+
+
+def test_should_time_function_in_seconds(app, mocker):
+    app.statsd_client = Mock()
+    mocker.patch("notifications_utils.statsd_decorators.time.perf_counter", side_effect=[10.0, 10.25])
+
+    @statsd(namespace="test")
+    def test_function():
+        return True
+
+    assert test_function()
+
+    app.statsd_client.timing.assert_called_once_with("test.test_function", 0.25)
+
+
+def test_should_not_time_function_if_statsd_not_enabled(app, mocker, caplog):
+    app.statsd_client = Mock(active=False)
+    mock_perf_counter = mocker.patch("notifications_utils.statsd_decorators.time.perf_counter")
+
+    @statsd(namespace="test")
+    def test_function():
+        return True
+
+    with caplog.at_level(logging.DEBUG):
+        assert test_function()
+
+    assert mock_perf_counter.called is False
+    assert app.statsd_client.incr.called is False
+    assert app.statsd_client.timing.called is False
+    assert caplog.messages == []
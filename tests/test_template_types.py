@@ -4,7 +4,7 @@ from time import process_time
 from unittest import mock
 
 import pytest
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 from freezegun import freeze_time
 from markupsafe import Markup
 from ordered_set import OrderedSet
@@ -23,6 +23,7 @@ from notifications_utils.template import (
     SMSPreviewTemplate,
     SubjectMixin,
     Template,
+    non_gsm_characters,
 )
 
 
@@ -61,9 +62,9 @@ def test_html_email_inserts_body():
     )
 
 
-@pytest.mark.parametrize("content", ("DOCTYPE", "html", "body", "GOV.UK", "hello world"))
-def test_default_template(content):
-    assert content in str(
+@pytest.fixture(scope="module")
+def default_html_email():
+    return str(
         HTMLEmailTemplate(
             {
                 "content": "hello world",
@@ -74,6 +75,11 @@ def test_default_template(content):
     )
 
 
+@pytest.mark.parametrize("content", ("DOCTYPE", "html", "body", "GOV.UK", "hello world"))
+def test_default_template(content, default_html_email):
+    assert content in default_html_email
+
+
 @pytest.mark.parametrize("show_banner", (True, False))
 def test_govuk_banner(show_banner):
     email = HTMLEmailTemplate(
@@ -198,8 +204,7 @@ def test_alt_text_with_no_govuk_banner(brand_banner, brand_text, expected_alt_te
         (False, "http://example.com/image.png", None, "#f00"),
     ],
 )
-@pytest.mark.parametrize("content", ("DOCTYPE", "html", "body"))
-def test_complete_html(complete_html, branding_should_be_present, brand_logo, brand_text, brand_colour, content):
+def test_complete_html(complete_html, branding_should_be_present, brand_logo, brand_text, brand_colour):
     email = str(
         HTMLEmailTemplate(
             {"content": "hello world", "subject": "", "template_type": "email"},
@@ -210,10 +215,11 @@ def test_complete_html(complete_html, branding_should_be_present, brand_logo, br
         )
     )
 
-    if complete_html:
-        assert content in email
-    else:
-        assert content not in email
+    for content in ("DOCTYPE", "html", "body"):
+        if complete_html:
+            assert content in email
+        else:
+            assert content not in email
 
     if branding_should_be_present:
         assert brand_logo in email
@@ -232,6 +238,7 @@ def test_subject_is_page_title():
             )
         ),
         features="html.parser",
+        parse_only=SoupStrainer("title"),
     )
     assert email.select_one("title").text == "this is the subject"
 
@@ -351,6 +358,15 @@ def test_markdown_in_templates(
     mock_markdown_renderer.assert_called_once_with(result)
 
 
+@pytest.fixture
+def html_email_body_only(mocker):
+    # For tests which only care about how the body is formatted, skip rendering the rest of the email around it
+    return mocker.patch(
+        "notifications_utils.template.HTMLEmailTemplate.jinja_template.render",
+        side_effect=lambda context: context["body"],
+    )
+
+
 @pytest.mark.parametrize(
     "template_class, template_type, extra_attributes",
     [
@@ -381,7 +397,9 @@ def test_markdown_in_templates(
         pytest.param("mailto:test@example.com", "mailto:test@example.com", marks=pytest.mark.xfail),
     ],
 )
-def test_makes_links_out_of_URLs(extra_attributes, template_class, template_type, url, url_with_entities_replaced):
+def test_makes_links_out_of_URLs(
+    extra_attributes, template_class, template_type, url, url_with_entities_replaced, html_email_body_only
+):
     assert f'<a {extra_attributes} href="{url_with_entities_replaced}">{url_with_entities_replaced}</a>' in str(
         template_class({"content": url, "subject": "", "template_type": template_type})
     )
@@ -441,7 +459,7 @@ def test_makes_links_out_of_URLs_without_protocol_in_sms_and(
         ),
     ),
 )
-def test_HTML_template_has_URLs_replaced_with_links(content, html_snippet):
+def test_HTML_template_has_URLs_replaced_with_links(content, html_snippet, html_email_body_only):
     assert html_snippet in str(HTMLEmailTemplate({"content": content, "subject": "", "template_type": "email"}))
 
 
@@ -458,7 +476,7 @@ def test_HTML_template_has_URLs_replaced_with_links(content, html_snippet):
         ("gov.uk?q=", "gov.uk?q="),
     ],
 )
-def test_escaping_govuk_in_email_templates(template_content, expected):
+def test_escaping_govuk_in_email_templates(template_content, expected, html_email_body_only):
     assert unlink_govuk_escaped(template_content) == expected
     assert expected in str(
         PlainTextEmailTemplate(
@@ -651,7 +669,7 @@ def test_phone_templates_normalise_whitespace(template_class):
     )
 
 
-@freeze_time("2012-12-12 12:12:12")
+@mock.patch("notifications_utils.template.datetime", utcnow=mock.Mock(return_value=datetime.datetime(2012, 12, 12, 12)))
 @mock.patch("notifications_utils.template.LetterPreviewTemplate.jinja_template.render")
 @mock.patch("notifications_utils.template.unlink_govuk_escaped")
 @mock.patch("notifications_utils.template.notify_letter_preview_markdown", return_value="Bar")
@@ -747,6 +765,7 @@ def test_letter_preview_renderer(
     letter_markdown,
     unlink_govuk,
     jinja_template,
+    mock_datetime,
     values,
     expected_address,
     contact_block,
@@ -809,6 +828,9 @@ def test_letter_preview_renderer_without_mocks(jinja_template):
     assert jinja_template_locals["logo_file_name"] is None
 
 
+_EXPECTED_QR_CODE_SVG = '<p>This is your link:</p><p><div class=\'qrcode\'><svg viewBox="0 0 25 25"><path stroke="#000" d="M0 0.5h7m1 0h2m1 0h1m2 0h1m3 0h7m-25 1h1m5 0h1m1 0h6m4 0h1m5 0h1m-25 1h1m1 0h3m1 0h1m1 0h1m2 0h1m1 0h1m1 0h2m1 0h1m1 0h3m1 0h1m-25 1h1m1 0h3m1 0h1m2 0h2m2 0h1m4 0h1m1 0h3m1 0h1m-25 1h1m1 0h3m1 0h1m1 0h1m5 0h1m1 0h1m1 0h1m1 0h3m1 0h1m-25 1h1m5 0h1m3 0h2m2 0h1m3 0h1m5 0h1m-25 1h7m1 0h1m1 0h1m1 0h1m1 0h1m1 0h1m1 0h7m-16 1h1m2 0h2m2 0h1m-17 1h1m2 0h6m1 0h2m4 0h2m2 0h1m1 0h3m-24 1h3m3 0h2m2 0h5m1 0h1m1 0h5m-24 1h1m3 0h1m1 0h3m2 0h1m1 0h1m1 0h2m1 0h2m1 0h1m2 0h1m-25 1h1m2 0h1m5 0h2m1 0h1m3 0h1m2 0h1m1 0h4m-24 1h1m3 0h2m1 0h1m1 0h1m4 0h2m1 0h1m5 0h1m-25 1h2m1 0h2m2 0h1m4 0h6m2 0h1m2 0h1m-24 1h3m2 0h3m2 0h1m4 0h4m1 0h5m-25 1h1m1 0h2m3 0h2m3 0h1m3 0h2m1 0h1m1 0h2m1 0h1m-25 1h1m5 0h1m1 0h2m1 0h3m2 0h5m1 0h2m-16 1h1m1 0h2m1 0h1m1 0h2m3 0h1m1 0h2m-24 1h7m1 0h3m1 0h1m3 0h1m1 0h1m1 0h1m3 0h1m-25 1h1m5 0h1m1 0h4m1 0h1m1 0h2m3 0h1m2 0h1m-24 1h1m1 0h3m1 0h1m1 0h1m2 0h2m1 0h7m2 0h2m-25 1h1m1 0h3m1 0h1m1 0h2m2 0h5m1 0h1m4 0h2m-25 1h1m1 0h3m1 0h1m4 0h2m4 0h1m2 0h5m-25 1h1m5 0h1m2 0h1m1 0h2m1 0h1m4 0h2m1 0h3m-25 1h7m1 0h1m1 0h5m1 0h2m3 0h1m2 0h1"/></svg></div></p>'  # noqa
+
+
 @mock.patch("notifications_utils.template.LetterPreviewTemplate.jinja_template.render")
 def test_letter_preview_renders_QR_code_correctly(jinja_template):
     str(
@@ -825,8 +847,21 @@ def test_letter_preview_renders_QR_code_correctly(jinja_template):
 
     jinja_template_locals = jinja_template.call_args_list[0][0][0]
 
-    expected_qr_code_svg = '<p>This is your link:</p><p><div class=\'qrcode\'><svg viewBox="0 0 25 25"><path stroke="#000" d="M0 0.5h7m1 0h2m1 0h1m2 0h1m3 0h7m-25 1h1m5 0h1m1 0h6m4 0h1m5 0h1m-25 1h1m1 0h3m1 0h1m1 0h1m2 0h1m1 0h1m1 0h2m1 0h1m1 0h3m1 0h1m-25 1h1m1 0h3m1 0h1m2 0h2m2 0h1m4 0h1m1 0h3m1 0h1m-25 1h1m1 0h3m1 0h1m1 0h1m5 0h1m1 0h1m1 0h1m1 0h3m1 0h1m-25 1h1m5 0h1m3 0h2m2 0h1m3 0h1m5 0h1m-25 1h7m1 0h1m1 0h1m1 0h1m1 0h1m1 0h1m1 0h7m-16 1h1m2 0h2m2 0h1m-17 1h1m2 0h6m1 0h2m4 0h2m2 0h1m1 0h3m-24 1h3m3 0h2m2 0h5m1 0h1m1 0h5m-24 1h1m3 0h1m1 0h3m2 0h1m1 0h1m1 0h2m1 0h2m1 0h1m2 0h1m-25 1h1m2 0h1m5 0h2m1 0h1m3 0h1m2 0h1m1 0h4m-24 1h1m3 0h2m1 0h1m1 0h1m4 0h2m1 0h1m5 0h1m-25 1h2m1 0h2m2 0h1m4 0h6m2 0h1m2 0h1m-24 1h3m2 0h3m2 0h1m4 0h4m1 0h5m-25 1h1m1 0h2m3 0h2m3 0h1m3 0h2m1 0h1m1 0h2m1 0h1m-25 1h1m5 0h1m1 0h2m1 0h3m2 0h5m1 0h2m-16 1h1m1 0h2m1 0h1m1 0h2m3 0h1m1 0h2m-24 1h7m1 0h3m1 0h1m3 0h1m1 0h1m1 0h1m3 0h1m-25 1h1m5 0h1m1 0h4m1 0h1m1 0h2m3 0h1m2 0h1m-24 1h1m1 0h3m1 0h1m1 0h1m2 0h2m1 0h7m2 0h2m-25 1h1m1 0h3m1 0h1m1 0h2m2 0h5m1 0h1m4 0h2m-25 1h1m1 0h3m1 0h1m4 0h2m4 0h1m2 0h5m-25 1h1m5 0h1m2 0h1m1 0h2m1 0h1m4 0h2m1 0h3m-25 1h7m1 0h1m1 0h5m1 0h2m3 0h1m2 0h1"/></svg></div></p>'  # noqa
-    assert jinja_template_locals["message"] == expected_qr_code_svg
+    assert jinja_template_locals["message"] == _EXPECTED_QR_CODE_SVG
+
+
+@pytest.mark.parametrize("template_class", (LetterPreviewTemplate, LetterPrintTemplate))
+def test_letter_templates_dont_check_included_templates_for_changes(template_class, mocker):
+    template = template_class(
+        {"content": "Foo", "subject": "Subject", "template_type": "letter"},
+        {"addressline1": "name", "addressline2": "street", "postcode": "SW1 1AA"},
+    )
+    str(template)
+    mock_getmtime = mocker.patch("os.path.getmtime")
+
+    str(template)
+
+    assert mock_getmtime.called is False
 
 
 @pytest.mark.parametrize(
@@ -1080,6 +1115,22 @@ def test_sms_fragment_count_accounts_for_unicode_and_welsh_characters(
     assert template.fragment_count == expected_sms_fragment_count
 
 
+@pytest.mark.parametrize(
+    "content, expected",
+    (
+        ("", set()),
+        ("Hello world 🚀 …", set()),
+        ("àèéìòù are all in GSM", set()),
+        ("Ŵêlsh chârâctêrs", {"Ŵ", "ê", "â"}),
+        ("ÿ" * 403, {"ÿ"}),
+        ("Hello world " * 50, set()),
+        ("Hello world " * 50 + "Ŵêlsh", {"Ŵ", "ê"}),
+    ),
+)
+def test_non_gsm_characters(content, expected):
+    assert non_gsm_characters(content) == expected
+
+
 @pytest.mark.parametrize(
     "msg, expected_sms_fragment_count",
     [